@@ -155,7 +155,7 @@ class ResearchLibrarian:
     def _search_knowledge_base(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search the knowledge base using semantic search."""
         try:
-            results = self.vector_store.similarity_search(query, n_results=limit)
+            results = [hit.asdict() for hit in self.vector_store.similarity_search(query, n_results=limit)]
             self.state.last_search_results = results
             return results
         except Exception as e:
@@ -175,7 +175,7 @@ class ResearchLibrarian:
         try:
             doc = self.document_store.get_document(doc_id)
             if doc and doc.get('content'):
-                return self.vector_store.similarity_search(doc['content'], n_results=limit)
+                return [hit.asdict() for hit in self.vector_store.similarity_search(doc['content'], n_results=limit)]
             return []
         except Exception as e:
             CliLogger.error(f"Error finding related documents for {doc_id}: {str(e)}")
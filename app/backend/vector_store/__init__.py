@@ -1,5 +1,6 @@
 """Vector store implementations for Research Assistant."""
 
-from .chroma_store import ChromaDocStore
+from .chroma_store import ChromaDocStore, SearchHit
+from .async_chroma_store import AsyncChromaDocStore
 
-__all__ = ['ChromaDocStore']
+__all__ = ['ChromaDocStore', 'AsyncChromaDocStore', 'SearchHit']
@@ -0,0 +1,213 @@
+"""
+Asynchronous ChromaDB Vector Store Implementation for Research Assistant.
+
+This module connects to a standalone chroma-server through ChromaDB's async
+HTTP client so that ingestion and search requests can be issued concurrently
+(e.g. with ``asyncio.gather``) instead of serializing on an embedded client.
+"""
+
+import asyncio
+import chromadb
+import numpy as np
+from chromadb.config import Settings
+from chromadb.utils import embedding_functions
+import logging
+from typing import List, Dict, Optional, Any
+import time
+from datetime import datetime
+from app.utils.cli_logger import CliLogger
+from .chroma_store import SearchHit, build_collection_metadata, _format_results, _normalize
+
+# Setup logging
+logger = logging.getLogger('research_assistant.vector_store')
+
+class AsyncChromaDocStore:
+    """Vector store implementation using ChromaDB's async HTTP client."""
+
+    def __init__(self, client: Any, collection: Any, embedding_function: Any, pool_size: int = 8):
+        """
+        Wrap a connected async client and collection. Use :meth:`create`
+        to build an instance.
+
+        Args:
+            client: ChromaDB async HTTP client
+            collection: Async collection handle
+            embedding_function: Embedding function used for documents and queries
+            pool_size: Maximum number of in-flight requests to the server
+        """
+        self.client = client
+        self.collection = collection
+        self.embedding_function = embedding_function
+        self._semaphore = asyncio.Semaphore(pool_size)
+
+    @classmethod
+    async def create(
+        cls,
+        host: str = "localhost",
+        port: int = 8000,
+        collection_name: str = "research_documents",
+        embedding_function: Optional[Any] = None,
+        model_name: str = "all-MiniLM-L6-v2",
+        pool_size: int = 8,
+        **collection_options: Any
+    ) -> "AsyncChromaDocStore":
+        """
+        Connect to a chroma-server and open the document collection.
+
+        Args:
+            host: chroma-server host
+            port: chroma-server port
+            collection_name: Name of the ChromaDB collection
+            embedding_function: Custom embedding function (optional)
+            model_name: SentenceTransformers model used when no custom
+                embedding function is given
+            pool_size: Maximum number of in-flight requests to the server
+            **collection_options: HNSW options, see
+                :func:`build_collection_metadata`
+
+        Returns:
+            Connected async document store
+        """
+        try:
+            CliLogger.info("Connecting to ChromaDB server...", context='database',
+                           details={"host": host, "port": port})
+
+            if not hasattr(chromadb, 'AsyncHttpClient'):
+                raise ImportError("AsyncChromaDocStore requires chromadb>=0.6.0")
+
+            client = await chromadb.AsyncHttpClient(
+                host=host,
+                port=port,
+                settings=Settings(anonymized_telemetry=False)
+            )
+
+            embedding_function = embedding_function or embedding_functions.SentenceTransformerEmbeddingFunction(
+                model_name=model_name,
+                normalize_embeddings=True
+            )
+
+            collection = await client.get_or_create_collection(
+                name=collection_name,
+                embedding_function=embedding_function,
+                metadata=build_collection_metadata(**collection_options)
+            )
+
+            CliLogger.success("ChromaDB server connected!", context='database',
+                              details={"collection": collection_name})
+            logger.info("Connected to ChromaDB server at %s:%s", host, port)
+            return cls(client, collection, embedding_function, pool_size)
+
+        except Exception as e:
+            CliLogger.error(f"Error connecting to ChromaDB server: {str(e)}")
+            logger.error("Error connecting to ChromaDB server: %s", e)
+            raise
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Compute L2-normalized embeddings in a worker thread so the event
+        loop stays free.
+        """
+        embeddings = await asyncio.to_thread(self.embedding_function, texts)
+        return _normalize(embeddings)
+
+    async def add_documents(
+        self,
+        documents: List[str],
+        metadatas: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+        batch_size: int = 166
+    ) -> List[str]:
+        """
+        Add documents to the vector store.
+
+        Sub-batches of ``batch_size`` are sent concurrently, bounded by the
+        store's ``pool_size``.
+
+        Args:
+            documents: List of document texts
+            metadatas: Optional list of metadata dictionaries
+            ids: Optional list of document IDs
+            batch_size: Number of documents per request
+
+        Returns:
+            List of document IDs
+        """
+        try:
+            if CliLogger.enabled:
+                CliLogger.info("Adding documents to vector store...", context='upload',
+                               details={"doc_count": len(documents)})
+
+            if ids is None:
+                now_ns = time.time_ns()
+                ids = [f"doc_{now_ns}_{i}" for i in range(len(documents))]
+
+            if metadatas is None:
+                timestamp = datetime.utcnow().isoformat()
+                metadatas = [{"timestamp": timestamp} for _ in range(len(documents))]
+
+            async def add_batch(start: int) -> None:
+                end = start + batch_size
+                async with self._semaphore:
+                    embeddings = await self._embed(documents[start:end])
+                    await self.collection.add(
+                        documents=documents[start:end],
+                        embeddings=embeddings,
+                        metadatas=metadatas[start:end],
+                        ids=ids[start:end]
+                    )
+
+            await asyncio.gather(*(add_batch(start) for start in range(0, len(documents), batch_size)))
+
+            if CliLogger.enabled:
+                CliLogger.success("Documents added successfully!", context='upload')
+            logger.info("Added %s documents to ChromaDB", len(documents))
+            return ids
+
+        except Exception as e:
+            CliLogger.error(f"Error adding documents: {str(e)}")
+            logger.error("Error adding documents to ChromaDB: %s", e)
+            raise
+
+    async def similarity_search(
+        self,
+        query: str,
+        n_results: int = 5,
+        metadata_filter: Optional[Dict] = None
+    ) -> List[SearchHit]:
+        """
+        Perform similarity search for a query.
+
+        Args:
+            query: Search query
+            n_results: Number of results to return
+            metadata_filter: Optional metadata filter
+
+        Returns:
+            Matches ordered by distance
+        """
+        try:
+            if CliLogger.enabled:
+                CliLogger.info("Performing similarity search...", context='search',
+                               details={"query": query, "n_results": n_results})
+
+            async with self._semaphore:
+                query_embeddings = await self._embed([query])
+                results = await self.collection.query(
+                    query_embeddings=query_embeddings,
+                    n_results=n_results,
+                    where=metadata_filter
+                )
+
+            hits = _format_results(results)
+
+            if CliLogger.enabled:
+                CliLogger.success("Search completed", context='search',
+                                  details={"results_found": len(hits)})
+
+            logger.info("Performed similarity search for query: %s", query)
+            return hits
+
+        except Exception as e:
+            CliLogger.error(f"Error performing similarity search: {str(e)}")
+            logger.error("Error performing similarity search: %s", e)
+            raise
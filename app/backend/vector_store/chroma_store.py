@@ -6,11 +6,22 @@ specifically designed for academic document management and citation tracking.
 """
 
 import chromadb
+import numpy as np
+import torch
 from chromadb.config import Settings
 from chromadb.utils import embedding_functions
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple, Union
 import os
+import time
+import functools
+import threading
+import json
+import multiprocessing
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from app.utils import performance_monitor, error_tracker
 from app.utils.cli_logger import CliLogger
@@ -18,6 +29,217 @@ from app.utils.cli_logger import CliLogger
 # Setup logging
 logger = logging.getLogger('research_assistant.vector_store')
 
+CLIENT_MODES = ('persistent', 'http')
+BACKENDS = ('chroma', 'faiss_ivfpq')
+
+# SQLite settings applied by ChromaDocStore.bulk_mode for large ingests
+BULK_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'mmap_size': 30000000000
+}
+
+_CLIENT_SETTINGS = Settings(
+    anonymized_telemetry=False,
+    allow_reset=True
+)
+
+@functools.lru_cache(maxsize=None)
+def _get_persistent_client(persist_directory: str) -> Any:
+    """Return the shared embedded client for a persist directory."""
+    # Create persist directory if it doesn't exist
+    os.makedirs(persist_directory, exist_ok=True)
+    return chromadb.PersistentClient(path=persist_directory, settings=_CLIENT_SETTINGS)
+
+@functools.lru_cache(maxsize=None)
+def _get_http_client(host: str, port: int) -> Any:
+    """Return the shared HTTP client for a chroma-server."""
+    return chromadb.HttpClient(host=host, port=port, settings=_CLIENT_SETTINGS)
+
+class _LRUCache:
+    """Thread-safe LRU mapping, trimmed to the size given on each insert."""
+    
+    def __init__(self):
+        self._items: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Any:
+        """Return the cached value for ``key``, or None."""
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+    
+    def put(self, key: Any, value: Any, maxsize: int) -> None:
+        """Cache ``value`` under ``key``, dropping the oldest entries beyond ``maxsize``."""
+        if maxsize <= 0:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > maxsize:
+                self._items.popitem(last=False)
+
+class _CacheState:
+    """Cache invalidation state shared by every store open on one collection."""
+    
+    def __init__(self):
+        self.epoch = 0
+        self.lock = threading.Lock()
+        # Memoized query embeddings and search results
+        self.query_embeddings = _LRUCache()
+        self.search_results = _LRUCache()
+        # Recently fetched documents by ID with the time they were fetched
+        self.documents: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        # HNSW ef_search currently in effect on the collection
+        self.ef_search: Optional[int] = None
+        self.tuning_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _get_cache_state(location: str, collection_name: str) -> _CacheState:
+    """Return the cache state of a collection, keyed by database location and name."""
+    return _CacheState()
+
+def build_collection_metadata(
+    hnsw_space: str = "ip",
+    hnsw_m: int = 16,
+    hnsw_ef_construction: int = 64,
+    hnsw_ef_search: int = 40,
+    hnsw_batch_size: int = 1000,
+    hnsw_sync_threshold: int = 10000
+) -> Dict[str, Any]:
+    """
+    Build the metadata used when creating a ChromaDB collection.
+
+    Args:
+        hnsw_space: Distance function of the HNSW index. Inner product
+            equals cosine similarity on the L2-normalized vectors the
+            stores write, without normalizing on every distance call.
+        hnsw_m: Maximum number of neighbours per HNSW graph node
+        hnsw_ef_construction: Candidate list size used while building
+            the graph
+        hnsw_ef_search: Candidate list size used while querying. Raising
+            it improves recall at the cost of query latency.
+        hnsw_batch_size: Number of vectors buffered before they are
+            applied to the HNSW graph
+        hnsw_sync_threshold: Number of vectors applied before the HNSW
+            graph is flushed to disk
+
+    Returns:
+        Collection metadata dictionary
+    """
+    return {
+        "hnsw:space": hnsw_space,
+        "hnsw:M": hnsw_m,
+        "hnsw:construction_ef": hnsw_ef_construction,
+        "hnsw:search_ef": hnsw_ef_search,
+        "hnsw:batch_size": hnsw_batch_size,
+        "hnsw:sync_threshold": hnsw_sync_threshold,
+        "created_at": datetime.utcnow().isoformat()
+    }
+
+# Number of stored vectors read per request when rebuilding the quantized index
+QUANTIZED_REBUILD_BATCH_SIZE = 1000
+
+# Number of texts sent to an embedding worker process per task
+EMBED_WORKER_CHUNK_SIZE = 256
+
+# SentenceTransformer model loaded once in each embedding worker process
+_worker_encoder = None
+_worker_encode_options: Dict[str, Any] = {}
+
+def _init_embedding_worker(model_name: str, batch_size: int, normalize_embeddings: bool) -> None:
+    """Load the embedding model in a freshly started worker process."""
+    global _worker_encoder, _worker_encode_options
+    from sentence_transformers import SentenceTransformer
+    
+    # One thread per process; parallelism comes from the process pool
+    torch.set_num_threads(1)
+    _worker_encoder = SentenceTransformer(model_name, device="cpu")
+    _worker_encode_options = {
+        "batch_size": batch_size,
+        "convert_to_numpy": True,
+        "normalize_embeddings": normalize_embeddings
+    }
+
+def _embed_in_worker(texts: List[str]) -> np.ndarray:
+    """Embed a chunk of texts with the worker's model."""
+    return _worker_encoder.encode(texts, **_worker_encode_options).astype(np.float32, copy=False)
+
+def _normalize(embeddings: Any) -> np.ndarray:
+    """
+    L2-normalize embeddings so inner product equals cosine similarity.
+
+    Returns a new float32 array; the input is never modified.
+    """
+    vectors = np.array(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms == 0, 1, norms)
+    return vectors
+
+class SearchHit(Mapping):
+    """
+    A single similarity search match.
+
+    Fields are attributes, but the hit is also a read-only mapping over
+    them, so ``hit['document']``, ``'distance' in hit`` and ``dict(hit)``
+    work. Use :meth:`asdict` for JSON output.
+    """
+    
+    __slots__ = ('id', 'document', 'metadata', 'distance')
+    
+    def __init__(
+        self,
+        id: str,
+        document: str,
+        metadata: Dict[str, Any],
+        distance: Optional[float]
+    ):
+        self.id = id
+        self.document = document
+        self.metadata = metadata
+        self.distance = distance
+    
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style access, e.g. ``hit['document']``."""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+    
+    def asdict(self) -> Dict[str, Any]:
+        """Return the match as a plain dictionary, e.g. for JSON output."""
+        return {
+            'id': self.id,
+            'document': self.document,
+            'metadata': self.metadata,
+            'distance': self.distance
+        }
+    
+    def __repr__(self) -> str:
+        return f"SearchHit(id={self.id!r}, distance={self.distance!r})"
+
+def _format_results(results: Dict[str, Any], query_index: int = 0) -> List[SearchHit]:
+    """Convert one query's slice of a ChromaDB query result into a list of matches."""
+    ids = results['ids'][query_index]
+    distances = results.get('distances')
+    return [
+        SearchHit(doc_id, document, metadata, distance)
+        for doc_id, document, metadata, distance in zip(
+            ids,
+            results['documents'][query_index],
+            results['metadatas'][query_index],
+            distances[query_index] if distances else [None] * len(ids)
+        )
+    ]
+
 class ChromaDocStore:
     """Vector store implementation using ChromaDB."""
     
@@ -26,7 +248,29 @@ class ChromaDocStore:
         self,
         persist_directory: str = "./data/chroma",
         collection_name: str = "research_documents",
-        embedding_function: Optional[Any] = None
+        embedding_function: Optional[Any] = None,
+        mode: str = "persistent",
+        host: str = "localhost",
+        port: int = 8000,
+        backend: str = "chroma",
+        faiss_index_factory: str = "IVF4096,PQ64",
+        faiss_nprobe: int = 16,
+        quantization: Optional[str] = None,
+        memory_map: bool = False,
+        search_cache_size: int = 1024,
+        cache_ttl: float = 60.0,
+        document_cache_size: int = 4096,
+        model_name: str = "all-MiniLM-L6-v2",
+        device: str = "cuda" if torch.cuda.is_available() else "cpu",
+        embed_batch_size: int = 64,
+        embed_workers: int = 0,
+        normalize_embeddings: bool = True,
+        hnsw_space: Optional[str] = None,
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 64,
+        hnsw_ef_search: int = 40,
+        hnsw_batch_size: int = 1000,
+        hnsw_sync_threshold: int = 10000
     ):
         """
         Initialize the ChromaDB document store.
@@ -35,39 +279,436 @@ class ChromaDocStore:
             persist_directory: Directory to persist ChromaDB data
             collection_name: Name of the ChromaDB collection
             embedding_function: Custom embedding function (optional)
+            mode: 'persistent' for an embedded on-disk database or 'http'
+                to connect to a chroma-server
+            host: chroma-server host (http mode only)
+            port: chroma-server port (http mode only)
+            backend: 'chroma' for ChromaDB's HNSW index or 'faiss_ivfpq'
+                for a product-quantized FAISS index, which trades a little
+                recall for a much smaller memory footprint on very large
+                collections
+            faiss_index_factory: FAISS index factory string (faiss_ivfpq only)
+            faiss_nprobe: Inverted lists scanned per query (faiss_ivfpq only)
+            quantization: Optional 'i8' or 'b1' to search a parallel
+                int8/binary USearch index instead of ChromaDB's float32
+                graph; documents and metadata are still read from ChromaDB
+                (chroma backend only). The index is rebuilt from ChromaDB
+                whenever its size differs from the collection's, e.g. after
+                writes by stores without quantization. Call :meth:`close`
+                to save it.
+            memory_map: Open an existing FAISS or quantized USearch index
+                memory-mapped and read-only, so only the parts touched by
+                queries are paged into RAM. ChromaDB's own HNSW index
+                cannot be memory-mapped and is unaffected.
+            search_cache_size: Number of recent queries whose embeddings
+                and results are memoized, shared by stores on the same
+                collection
+            cache_ttl: Maximum age in seconds of memoized search results
+                and cached documents, so writes made by other processes
+                become visible; 0 keeps them until a write through a store
+                in this process
+            document_cache_size: Number of recently fetched documents kept
+                in memory for ID lookups, shared by stores on the same
+                collection
+            model_name: SentenceTransformers model used when no custom
+                embedding function is given
+            device: Device to run the embedding model on ('cuda' or 'cpu')
+            embed_batch_size: Mini-batch size for embedding generation
+            embed_workers: Number of worker processes used to embed large
+                ingests on CPU with the default model; 0 or 1 embeds in
+                this process. Call :meth:`close` to stop the workers.
+            normalize_embeddings: L2-normalize document and query embeddings
+                so the default inner-product space ranks by cosine similarity
+            hnsw_space: HNSW distance function. Defaults to 'ip' when
+                embeddings are normalized and 'cosine' otherwise.
+            hnsw_*: Other HNSW index options, see
+                :func:`build_collection_metadata`
         """
+        if mode not in CLIENT_MODES:
+            raise ValueError(f"Unsupported client mode: {mode}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unsupported vector store backend: {backend}")
+        if hnsw_space is None:
+            hnsw_space = "ip" if normalize_embeddings else "cosine"
+        elif hnsw_space == "ip" and not normalize_embeddings:
+            logger.warning("hnsw_space='ip' without normalize_embeddings ranks by raw dot product")
+        
         self.persist_directory = persist_directory
         self.collection_name = collection_name
-        
-        # Create persist directory if it doesn't exist
-        os.makedirs(persist_directory, exist_ok=True)
+        self.mode = mode
+        self.backend = backend
+        self.model_name = model_name
+        self.device = device
+        self.embed_batch_size = embed_batch_size
+        self.embed_workers = embed_workers
+        self._embed_executor: Optional[ProcessPoolExecutor] = None
+        self.normalize_embeddings = normalize_embeddings
         
         CliLogger.info("Initializing ChromaDB...", context='database',
-                       details={"persist_dir": persist_directory})
-        
-        # Initialize ChromaDB client
-        self.client = chromadb.PersistentClient(
-            path=persist_directory,
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True
-            )
-        )
+                       details={"mode": mode, "backend": backend, "persist_dir": persist_directory})
         
         # Setup embedding function
-        self.embedding_function = embedding_function or embedding_functions.DefaultEmbeddingFunction()
-        
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name=collection_name,
-            embedding_function=self.embedding_function,
-            metadata={"created_at": datetime.utcnow().isoformat()}
+        self.embedding_function = embedding_function or embedding_functions.SentenceTransformerEmbeddingFunction(
+            model_name=model_name,
+            device=device,
+            normalize_embeddings=normalize_embeddings
         )
+        # Direct handle on the SentenceTransformer model so ingestion can
+        # control the encode batch size; None for custom embedding functions
+        self._encoder = None if embedding_function else getattr(self.embedding_function, '_model', None)
+        
+        # Memoized query embeddings and search results, shared by every store
+        # on the same collection so short-lived stores still get cache hits.
+        # Writes through any of them bump the shared cache epoch instead of
+        # clearing, so a search that started before a write can never
+        # repopulate the cache with stale results. Results also expire after
+        # cache_ttl to pick up writes from other processes.
+        location = f"{host}:{port}" if mode == 'http' and backend == 'chroma' else os.path.abspath(persist_directory)
+        self._cache_state = _get_cache_state(location, collection_name)
+        self.cache_ttl = cache_ttl
+        self.search_cache_size = search_cache_size
+        # Stores with different embedding models must not share embeddings
+        self._embedding_key = (embedding_function or model_name, normalize_embeddings)
+        
+        # Recently fetched documents live in the shared cache state and are
+        # evicted selectively when a document is updated or deleted
+        self._document_cache_size = document_cache_size
+        
+        if backend == 'faiss_ivfpq':
+            from .faiss_index import FaissIVFPQIndex
+            
+            # The FAISS index stands in for the ChromaDB collection and is
+            # safe to share between concurrent readers
+            os.makedirs(persist_directory, exist_ok=True)
+            self.client = None
+            self.collection = FaissIVFPQIndex(
+                index_path=os.path.join(persist_directory, f"{collection_name}.faiss"),
+                dimension=self._embedding_dimension(),
+                index_factory=faiss_index_factory,
+                nprobe=faiss_nprobe,
+                memory_map=memory_map
+            )
+            self._ef_search_tunable = False
+        else:
+            # ChromaDB clients are shared by every store pointing at the same
+            # database; each store only holds a cheap, thread-safe collection
+            # handle backed by the shared client
+            if mode == 'http':
+                self.client = _get_http_client(host, port)
+            else:
+                self.client = _get_persistent_client(os.path.abspath(persist_directory))
+            
+            # Get or create collection. HNSW parameters only take effect when
+            # the collection is first created.
+            self.collection = self.client.get_or_create_collection(
+                name=collection_name,
+                embedding_function=self.embedding_function,
+                metadata=build_collection_metadata(
+                    hnsw_space=hnsw_space,
+                    hnsw_m=hnsw_m,
+                    hnsw_ef_construction=hnsw_ef_construction,
+                    hnsw_ef_search=hnsw_ef_search,
+                    hnsw_batch_size=hnsw_batch_size,
+                    hnsw_sync_threshold=hnsw_sync_threshold
+                )
+            )
+            
+            # Current HNSW query-time candidate list size, shared by every
+            # store on the collection; changed at most once per tuning change
+            # rather than on every query
+            with self._cache_state.tuning_lock:
+                if self._cache_state.ef_search is None:
+                    self._cache_state.ef_search = (self.collection.metadata or {}).get("hnsw:search_ef", hnsw_ef_search)
+            self._ef_search_tunable = True
+        
+        self._quantized_index = None
+        self._quantized_lock = threading.Lock()
+        self._quantized_checked_at: Optional[Tuple[int, int]] = None
+        self._quantized_in_sync = False
+        if quantization is not None and backend == 'chroma':
+            from .usearch_index import USearchQuantizedIndex
+            
+            os.makedirs(persist_directory, exist_ok=True)
+            self._quantized_index = USearchQuantizedIndex(
+                index_path=os.path.join(persist_directory, f"{collection_name}.usearch"),
+                dimension=self._embedding_dimension(),
+                quantization=quantization,
+                connectivity=hnsw_m,
+                expansion_add=hnsw_ef_construction,
+                memory_map=memory_map
+            )
+        elif memory_map and backend == 'chroma':
+            logger.warning("memory_map has no effect on ChromaDB's HNSW index without quantization")
         
         CliLogger.success("ChromaDB initialized successfully!", context='database',
                          details={"collection": collection_name})
         
-        logger.info(f"Initialized ChromaDB store at {persist_directory}")
+        logger.info("Initialized ChromaDB store at %s", persist_directory)
+    
+    @contextmanager
+    def bulk_mode(self) -> Iterator["ChromaDocStore"]:
+        """
+        Relax SQLite durability settings for the duration of a bulk ingest.
+
+        Switches the embedded ChromaDB database to WAL journaling with
+        ``synchronous=NORMAL``, in-memory temp storage and a large mmap
+        window, then restores the previous settings on exit. A crash during
+        bulk mode cannot corrupt the database, but the most recent
+        transactions may be lost. The settings apply to the calling
+        thread's connection, so run the ingest on that thread. Has no
+        effect in http mode or on the FAISS backend.
+
+        Example:
+            with store.bulk_mode():
+                store.add_documents(documents, metadatas)
+        """
+        sysdb = getattr(getattr(self.client, '_server', None), '_sysdb', None)
+        pool = getattr(sysdb, '_conn_pool', None)
+        if pool is None:
+            logger.warning("Bulk mode is only available for embedded ChromaDB stores")
+            yield self
+            return
+        
+        conn = pool.connect()
+        previous = {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in BULK_PRAGMAS}
+        for name, value in BULK_PRAGMAS.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        logger.info("Enabled SQLite bulk mode for %s", self.persist_directory)
+        try:
+            yield self
+        finally:
+            for name, value in previous.items():
+                conn.execute(f"PRAGMA {name} = {value}")
+            pool.return_to_pool(conn)
+            logger.info("Restored SQLite settings for %s", self.persist_directory)
+    
+    def _set_ef_search(self, ef_search: int) -> None:
+        """
+        Update the collection's HNSW ``ef_search`` if it differs from the
+        value currently in effect.
+
+        Requires the collection configuration API of ChromaDB 1.0 or later.
+        Older releases only read ``hnsw:search_ef`` when the index segment
+        is created, so the setting is left unchanged there with a warning.
+
+        Args:
+            ef_search: New query-time candidate list size
+        """
+        state = self._cache_state
+        if ef_search == state.ef_search or not self._ef_search_tunable:
+            return
+        
+        with state.tuning_lock:
+            if ef_search == state.ef_search or not self._ef_search_tunable:
+                return
+            try:
+                self.collection.modify(configuration={"hnsw": {"ef_search": ef_search}})
+            except TypeError:
+                self._ef_search_tunable = False
+                logger.warning(
+                    "This ChromaDB release cannot change ef_search after creation; keeping %s",
+                    state.ef_search
+                )
+                return
+            state.ef_search = ef_search
+            self._invalidate_caches()
+            logger.info("Set HNSW ef_search to %s", ef_search)
+    
+    def _quantized_index_current(self) -> bool:
+        """
+        Whether the quantized index holds every stored vector.
+
+        Checked at most once per cache epoch and ``cache_ttl`` window. A
+        writable index that has fallen behind is rebuilt from ChromaDB; a
+        read-only one is bypassed until it matches again.
+        """
+        checked_at = (self._cache_state.epoch, self._cache_window())
+        if checked_at == self._quantized_checked_at:
+            return self._quantized_in_sync
+        
+        with self._quantized_lock:
+            if checked_at != self._quantized_checked_at:
+                in_sync = self._quantized_index.count() == self.collection.count()
+                if not in_sync and not self._quantized_index.read_only:
+                    self._rebuild_quantized_index()
+                    in_sync = True
+                elif not in_sync:
+                    logger.warning("Read-only quantized index is out of date, searching ChromaDB instead")
+                self._quantized_in_sync = in_sync
+                self._quantized_checked_at = checked_at
+        return self._quantized_in_sync
+    
+    def _rebuild_quantized_index(self) -> None:
+        """Refill the quantized index with the vectors stored in ChromaDB."""
+        total = self.collection.count()
+        logger.info("Rebuilding quantized index from %s stored vectors", total)
+        self._quantized_index.clear()
+        for offset in range(0, total, QUANTIZED_REBUILD_BATCH_SIZE):
+            batch = self.collection.get(include=['embeddings'], limit=QUANTIZED_REBUILD_BATCH_SIZE, offset=offset)
+            if batch['ids']:
+                self._quantized_index.add(batch['ids'], batch['embeddings'])
+        self._quantized_index.flush()
+    
+    def _invalidate_caches(self, ids: Optional[List[str]] = None) -> None:
+        """
+        Make memoized search results of every store on this collection
+        unreachable and evict the given documents from the shared cache.
+
+        Eviction and the epoch bump happen under one lock, so a fetch that
+        read a document before the write cannot cache it afterwards.
+        """
+        with self._cache_state.lock:
+            for doc_id in ids or ():
+                self._cache_state.documents.pop(doc_id, None)
+            self._cache_state.epoch += 1
+    
+    def _cache_window(self) -> int:
+        """Return the current ``cache_ttl`` time window, part of the search cache key."""
+        if self.cache_ttl <= 0:
+            return 0
+        return int(time.monotonic() // self.cache_ttl)
+    
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a single query string, memoized in the shared cache state."""
+        key = (self._embedding_key, query)
+        embedding = self._cache_state.query_embeddings.get(key)
+        if embedding is None:
+            embedding = self._embed([query])
+            self._cache_state.query_embeddings.put(key, embedding, self.search_cache_size)
+        return embedding
+    
+    def _search_cached(
+        self,
+        query: str,
+        n_results: int,
+        metadata_filter: Optional[Dict]
+    ) -> List[SearchHit]:
+        """
+        Run a text query, memoized in the shared cache state.
+
+        The cache key includes the cache epoch the search started in and the
+        current ``cache_ttl`` window, so results go stale on any write and
+        after ``cache_ttl``.
+        """
+        filter_key = json.dumps(metadata_filter, sort_keys=True) if metadata_filter else None
+        key = (
+            self._embedding_key, self._quantized_index is not None, query, n_results, filter_key,
+            self._cache_state.epoch, self._cache_window()
+        )
+        results = self._cache_state.search_results.get(key)
+        if results is None:
+            results = _format_results(self._query(self._embed_query(query), n_results, metadata_filter))
+            self._cache_state.search_results.put(key, results, self.search_cache_size)
+        return results
+    
+    def _query(
+        self,
+        query_embeddings: np.ndarray,
+        n_results: int,
+        metadata_filter: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """
+        Run a nearest-neighbour query, returning ChromaDB's query layout.
+
+        Unfiltered queries go through the quantized index when one is
+        configured and up to date, and the hits are joined with ChromaDB
+        by ID.
+        """
+        if self._quantized_index is None or metadata_filter or not self._quantized_index_current():
+            return self.collection.query(
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=metadata_filter
+            )
+        
+        results: Dict[str, List[List[Any]]] = {'ids': [], 'documents': [], 'metadatas': [], 'distances': []}
+        for ids, distances in self._quantized_index.search(query_embeddings, n_results):
+            stored = self.collection.get(ids=ids) if ids else {'ids': [], 'documents': [], 'metadatas': []}
+            rows = {
+                doc_id: (document, metadata)
+                for doc_id, document, metadata in zip(stored['ids'], stored['documents'], stored['metadatas'])
+            }
+            hits = [(doc_id, distance) for doc_id, distance in zip(ids, distances) if doc_id in rows]
+            results['ids'].append([doc_id for doc_id, _ in hits])
+            results['documents'].append([rows[doc_id][0] for doc_id, _ in hits])
+            results['metadatas'].append([rows[doc_id][1] for doc_id, _ in hits])
+            results['distances'].append([distance for _, distance in hits])
+        return results
+    
+    def _embedding_dimension(self) -> int:
+        """Return the dimension of the vectors produced by the embedding function."""
+        if self._encoder is not None:
+            return self._encoder.get_sentence_embedding_dimension()
+        return len(self._embed(["dimension probe"])[0])
+    
+    def _use_embed_workers(self, n_texts: int) -> bool:
+        """Whether a batch is large enough to shard across worker processes."""
+        return (
+            self.embed_workers > 1
+            and self.device == "cpu"
+            and self._encoder is not None
+            and n_texts > EMBED_WORKER_CHUNK_SIZE
+        )
+    
+    def _get_embed_executor(self) -> ProcessPoolExecutor:
+        """Start the embedding worker pool on first use and reuse it afterwards."""
+        if self._embed_executor is None:
+            # Spawn rather than fork, since this process has already loaded
+            # (and may have run) torch
+            self._embed_executor = ProcessPoolExecutor(
+                max_workers=self.embed_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_embedding_worker,
+                initargs=(self.model_name, self.embed_batch_size, self.normalize_embeddings)
+            )
+            logger.info("Started %s embedding worker processes", self.embed_workers)
+        return self._embed_executor
+    
+    def close(self) -> None:
+        """
+        Save the quantized index, if any, and shut down the embedding
+        worker processes, if any were started.
+        """
+        if self._quantized_index is not None and not self._quantized_index.read_only:
+            with self._quantized_lock:
+                self._quantized_index.flush()
+        if self._embed_executor is not None:
+            self._embed_executor.shutdown()
+            self._embed_executor = None
+            logger.info("Stopped embedding worker processes")
+    
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Compute embeddings for texts in mini-batches of ``embed_batch_size``.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dimension)
+        """
+        if self._use_embed_workers(len(texts)):
+            chunks = [
+                texts[start:start + EMBED_WORKER_CHUNK_SIZE]
+                for start in range(0, len(texts), EMBED_WORKER_CHUNK_SIZE)
+            ]
+            return np.vstack(list(self._get_embed_executor().map(_embed_in_worker, chunks)))
+        
+        if self._encoder is not None:
+            return self._encoder.encode(
+                texts,
+                batch_size=self.embed_batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=self.normalize_embeddings
+            ).astype(np.float32, copy=False)
+        
+        embeddings = []
+        for start in range(0, len(texts), self.embed_batch_size):
+            embeddings.extend(self.embedding_function(texts[start:start + self.embed_batch_size]))
+        
+        if self.normalize_embeddings and embeddings:
+            return _normalize(embeddings)
+        return np.asarray(embeddings, dtype=np.float32)
     
     @performance_monitor.log_execution_time
     @error_tracker.handle_exception()
@@ -75,42 +716,117 @@ class ChromaDocStore:
         self,
         documents: List[str],
         metadatas: Optional[List[Dict]] = None,
-        ids: Optional[List[str]] = None
+        ids: Optional[List[str]] = None,
+        batch_size: int = 166,
+        embeddings: Optional[np.ndarray] = None
     ) -> List[str]:
         """
         Add documents to the vector store.
 
+        Duplicate IDs within the call (first occurrence wins) and IDs that
+        are already stored are skipped, so re-ingesting after a partial
+        failure does not abort the whole batch. Generated IDs are unique,
+        so the check only runs when ``ids`` are given.
+
+        Embeddings are computed up front in mini-batches and handed to
+        ChromaDB, which then skips its own embedding pass. Documents are
+        written in sub-batches of ``batch_size`` so each ``collection.add``
+        call stays within ChromaDB's recommended 100-250 item range.
+
         Args:
             documents: List of document texts
             metadatas: Optional list of metadata dictionaries
             ids: Optional list of document IDs
+            batch_size: Number of documents per ``collection.add`` call
+            embeddings: Optional precomputed embeddings of shape
+                (len(documents), dimension). The embedding step is skipped
+                and the array is handed to ChromaDB without converting it
+                to Python lists; a float32, C-contiguous array is not copied
+                unless normalization is enabled. ChromaDB still validates
+                every value.
 
         Returns:
-            List of document IDs
+            List of document IDs, including any that were already stored
         """
         try:
-            CliLogger.info("Adding documents to vector store...", context='upload',
-                           details={"doc_count": len(documents)})
+            if CliLogger.enabled:
+                CliLogger.info("Adding documents to vector store...", context='upload',
+                               details={"doc_count": len(documents)})
             
+            check_ids = ids is not None
             if ids is None:
-                ids = [f"doc_{i}_{datetime.utcnow().timestamp()}" for i in range(len(documents))]
+                now_ns = time.time_ns()
+                ids = [f"doc_{now_ns}_{i}" for i in range(len(documents))]
             
             if metadatas is None:
-                metadatas = [{"timestamp": datetime.utcnow().isoformat()} for _ in documents]
+                timestamp = datetime.utcnow().isoformat()
+                metadatas = [{"timestamp": timestamp} for _ in range(len(documents))]
             
-            self.collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids
-            )
+            if embeddings is not None:
+                if len(embeddings) != len(documents):
+                    raise ValueError(
+                        f"Got {len(embeddings)} embeddings for {len(documents)} documents"
+                    )
+                embeddings = (
+                    _normalize(embeddings) if self.normalize_embeddings
+                    else np.ascontiguousarray(embeddings, dtype=np.float32)
+                )
+            
+            # Skip duplicate IDs within the call and IDs that are already
+            # stored; ChromaDB would otherwise reject the whole sub-batch
+            all_ids = ids
+            keep = range(len(ids))
+            if check_ids:
+                positions: Dict[str, int] = {}
+                for i, doc_id in enumerate(ids):
+                    positions.setdefault(doc_id, i)
+                unique_ids = list(positions)
+                existing = set()
+                for start in range(0, len(unique_ids), batch_size):
+                    existing.update(self.collection.get(ids=unique_ids[start:start + batch_size], include=[])['ids'])
+                keep = [i for doc_id, i in positions.items() if doc_id not in existing]
+            
+            if len(keep) != len(ids):
+                logger.warning(
+                    "Skipping %s documents with duplicate or existing IDs",
+                    len(ids) - len(keep)
+                )
+                documents = [documents[i] for i in keep]
+                metadatas = [metadatas[i] for i in keep]
+                ids = [ids[i] for i in keep]
+                if embeddings is not None:
+                    embeddings = embeddings[keep]
             
-            CliLogger.success("Documents added successfully!", context='upload')
-            logger.info(f"Added {len(documents)} documents to ChromaDB")
-            return ids
+            if embeddings is None:
+                embeddings = self._embed(documents)
+            
+            # The FAISS index rewrites its file on every add, so it receives
+            # the whole call at once
+            if self.backend != 'chroma':
+                batch_size = max(len(documents), 1)
+            
+            for start in range(0, len(documents), batch_size):
+                end = start + batch_size
+                self.collection.add(
+                    documents=documents[start:end],
+                    embeddings=embeddings[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end]
+                )
+            
+            if self._quantized_index is not None and ids:
+                with self._quantized_lock:
+                    self._quantized_index.add(ids, embeddings)
+            self._invalidate_caches()
+            
+            if CliLogger.enabled:
+                CliLogger.success("Documents added successfully!", context='upload')
+            logger.info("Added %s documents to ChromaDB", len(documents))
+            return all_ids
             
         except Exception as e:
             CliLogger.error(f"Error adding documents: {str(e)}")
-            logger.error(f"Error adding documents to ChromaDB: {str(e)}")
+            logger.error("Error adding documents to ChromaDB: %s", e)
             raise
     
     @performance_monitor.log_execution_time
@@ -119,8 +835,10 @@ class ChromaDocStore:
         self,
         query: str,
         n_results: int = 5,
-        metadata_filter: Optional[Dict] = None
-    ) -> List[Dict]:
+        metadata_filter: Optional[Dict] = None,
+        ef_search: Optional[int] = None,
+        query_embedding: Optional[Union[List[float], np.ndarray]] = None
+    ) -> List[SearchHit]:
         """
         Perform similarity search for a query.
 
@@ -128,40 +846,102 @@ class ChromaDocStore:
             query: Search query
             n_results: Number of results to return
             metadata_filter: Optional metadata filter
+            ef_search: Optional HNSW query-time candidate list size. Higher
+                values trade latency for recall; ``max(n_results * 2, 40)``
+                is a good starting point for large ``n_results``. The value
+                persists on the collection until changed again. Requires
+                ChromaDB 1.0 or later; ignored with a warning on older
+                releases and by the FAISS backend.
+            query_embedding: Optional precomputed query embedding, e.g. when
+                fanning the same query out to several collections. Results
+                for precomputed embeddings are not memoized.
 
         Returns:
-            List of matching documents with metadata
+            Matches ordered by distance. Memoized results are shared between
+            callers and should not be modified.
         """
         try:
-            CliLogger.info("Performing similarity search...", context='search',
-                           details={"query": query, "n_results": n_results})
+            if CliLogger.enabled:
+                CliLogger.info("Performing similarity search...", context='search',
+                               details={"query": query, "n_results": n_results})
             
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=n_results,
-                where=metadata_filter
-            )
+            if ef_search is not None and self.backend == 'chroma':
+                self._set_ef_search(max(ef_search, n_results))
             
-            CliLogger.success("Search completed", context='search',
-                              details={"results_found": len(results['ids'][0])})
+            if query_embedding is not None:
+                query_embeddings = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+                if self.normalize_embeddings:
+                    query_embeddings = _normalize(query_embeddings)
+                results = _format_results(self._query(query_embeddings, n_results, metadata_filter))
+            else:
+                results = list(self._search_cached(query, n_results, metadata_filter))
             
-            logger.info(f"Performed similarity search for query: {query}")
+            if CliLogger.enabled:
+                CliLogger.success("Search completed", context='search',
+                                  details={"results_found": len(results)})
             
-            # Format results
-            formatted_results = []
-            for i in range(len(results['ids'][0])):
-                formatted_results.append({
-                    'id': results['ids'][0][i],
-                    'document': results['documents'][0][i],
-                    'metadata': results['metadatas'][0][i],
-                    'distance': results['distances'][0][i] if 'distances' in results else None
-                })
+            logger.info("Performed similarity search for query: %s", query)
             
-            return formatted_results
+            return results
             
         except Exception as e:
             CliLogger.error(f"Error performing similarity search: {str(e)}")
-            logger.error(f"Error performing similarity search: {str(e)}")
+            logger.error("Error performing similarity search: %s", e)
+            raise
+    
+    @performance_monitor.log_execution_time
+    @error_tracker.handle_exception()
+    def similarity_search_batch(
+        self,
+        queries: List[str],
+        n_results: int = 5,
+        metadata_filter: Optional[Dict] = None,
+        ef_search: Optional[int] = None
+    ) -> List[List[SearchHit]]:
+        """
+        Perform similarity search for several queries in one call.
+
+        All queries are embedded in a single batched forward pass and sent
+        to the index as one query, which is much cheaper than calling
+        :meth:`similarity_search` once per query. Results are not memoized.
+
+        Args:
+            queries: Search queries
+            n_results: Number of results to return per query
+            metadata_filter: Optional metadata filter applied to every query
+            ef_search: Optional HNSW query-time candidate list size, see
+                :meth:`similarity_search`
+
+        Returns:
+            One list of matches per query, in the order of ``queries``
+        """
+        try:
+            if CliLogger.enabled:
+                CliLogger.info("Performing batched similarity search...", context='search',
+                               details={"query_count": len(queries), "n_results": n_results})
+            
+            if not queries:
+                return []
+            
+            if ef_search is not None and self.backend == 'chroma':
+                self._set_ef_search(max(ef_search, n_results))
+            
+            query_embeddings = self._embed(queries)
+            results = self._query(query_embeddings, n_results, metadata_filter)
+            
+            hits = [_format_results(results, query_index) for query_index in range(len(queries))]
+            
+            if CliLogger.enabled:
+                CliLogger.success("Batched search completed", context='search',
+                                  details={"results_found": sum(len(query_hits) for query_hits in hits)})
+            
+            logger.info("Performed batched similarity search for %s queries", len(queries))
+            
+            return hits
+            
+        except Exception as e:
+            CliLogger.error(f"Error performing batched similarity search: {str(e)}")
+            logger.error("Error performing batched similarity search: %s", e)
             raise
     
     @error_tracker.handle_exception()
@@ -173,48 +953,118 @@ class ChromaDocStore:
             ids: List of document IDs to delete
         """
         try:
-            CliLogger.info("Deleting documents from vector store...", context='delete',
-                           details={"doc_count": len(ids)})
+            if CliLogger.enabled:
+                CliLogger.info("Deleting documents from vector store...", context='delete',
+                               details={"doc_count": len(ids)})
             
             self.collection.delete(ids=ids)
+            if self._quantized_index is not None:
+                with self._quantized_lock:
+                    self._quantized_index.delete(ids)
+            self._invalidate_caches(ids)
             
-            CliLogger.success("Documents deleted successfully!", context='delete')
-            logger.info(f"Deleted {len(ids)} documents from ChromaDB")
+            if CliLogger.enabled:
+                CliLogger.success("Documents deleted successfully!", context='delete')
+            logger.info("Deleted %s documents from ChromaDB", len(ids))
         except Exception as e:
             CliLogger.error(f"Error deleting documents: {str(e)}")
-            logger.error(f"Error deleting documents: {str(e)}")
+            logger.error("Error deleting documents: %s", e)
             raise
     
     @error_tracker.handle_exception()
-    def get_document(self, doc_id: str) -> Optional[Dict]:
+    def get_documents(self, ids: List[str]) -> List[Dict]:
         """
-        Retrieve a specific document by ID.
+        Retrieve several documents by ID in a single round-trip.
+
+        Recently fetched documents are served from an in-memory LRU cache
+        shared by stores on the same collection; only the remaining IDs are
+        read from the vector store.
 
         Args:
-            doc_id: Document ID
+            ids: Document IDs
 
         Returns:
-            Document data if found, None otherwise
+            Data of the documents found, in the order of ``ids``
         """
         try:
-            CliLogger.info("Retrieving document from vector store...", context='retrieve',
-                           details={"doc_id": doc_id})
-            
-            result = self.collection.get(ids=[doc_id])
-            if result['ids']:
-                CliLogger.success("Document retrieved successfully!", context='retrieve')
-                return {
-                    'id': result['ids'][0],
-                    'document': result['documents'][0],
-                    'metadata': result['metadatas'][0]
+            if CliLogger.enabled:
+                CliLogger.info("Retrieving documents from vector store...", context='retrieve',
+                               details={"doc_count": len(ids)})
+            
+            state = self._cache_state
+            found: Dict[str, Dict] = {}
+            now = time.monotonic()
+            with state.lock:
+                # Read before fetching, so a write that lands during the
+                # fetch is detected and its stale rows are not cached
+                epoch = state.epoch
+                if self._document_cache_size > 0:
+                    for doc_id in ids:
+                        entry = state.documents.get(doc_id)
+                        if entry is None:
+                            continue
+                        if self.cache_ttl > 0 and now - entry[0] > self.cache_ttl:
+                            del state.documents[doc_id]
+                            continue
+                        state.documents.move_to_end(doc_id)
+                        found[doc_id] = entry[1]
+            
+            # Repeated IDs are fetched once; ChromaDB rejects duplicates
+            missing = list(dict.fromkeys(doc_id for doc_id in ids if doc_id not in found))
+            if missing:
+                result = self.collection.get(ids=missing)
+                
+                fetched = {
+                    doc_id: {'id': doc_id, 'document': document, 'metadata': metadata}
+                    for doc_id, document, metadata in zip(result['ids'], result['documents'], result['metadatas'])
                 }
-            CliLogger.error("Document not found", context='retrieve')
-            return None
+                found.update(fetched)
+                
+                if self._document_cache_size > 0:
+                    with state.lock:
+                        if state.epoch == epoch:
+                            state.documents.update((doc_id, (now, doc)) for doc_id, doc in fetched.items())
+                            while len(state.documents) > self._document_cache_size:
+                                state.documents.popitem(last=False)
+            
+            # Copy the metadata too, so callers can never modify cached entries
+            documents = [
+                {
+                    'id': doc_id,
+                    'document': found[doc_id]['document'],
+                    'metadata': None if found[doc_id]['metadata'] is None else dict(found[doc_id]['metadata'])
+                }
+                for doc_id in ids if doc_id in found
+            ]
+            
+            if CliLogger.enabled:
+                CliLogger.success("Documents retrieved successfully!", context='retrieve',
+                                  details={"found": len(documents)})
+            return documents
         except Exception as e:
-            CliLogger.error(f"Error retrieving document: {str(e)}")
-            logger.error(f"Error retrieving document {doc_id}: {str(e)}")
+            CliLogger.error(f"Error retrieving documents: {str(e)}")
+            logger.error("Error retrieving documents %s: %s", ids, e)
             raise
     
+    def get_document(self, doc_id: str) -> Optional[Dict]:
+        """
+        Retrieve a specific document by ID.
+
+        Kept for single lookups; prefer :meth:`get_documents` when fetching
+        several documents.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            Document data if found, None otherwise
+        """
+        documents = self.get_documents([doc_id])
+        if documents:
+            return documents[0]
+        CliLogger.error("Document not found", context='retrieve')
+        return None
+    
     @error_tracker.handle_exception()
     def update_document(
         self,
@@ -231,21 +1081,30 @@ class ChromaDocStore:
             metadata: Optional new metadata
         """
         try:
-            CliLogger.info("Updating document in vector store...", context='update',
-                           details={"doc_id": doc_id})
+            if CliLogger.enabled:
+                CliLogger.info("Updating document in vector store...", context='update',
+                               details={"doc_id": doc_id})
             
             if metadata is None:
                 metadata = {"updated_at": datetime.utcnow().isoformat()}
             
+            embeddings = self._embed([document])
             self.collection.update(
                 ids=[doc_id],
+                embeddings=embeddings,
                 documents=[document],
                 metadatas=[metadata]
             )
+            if self._quantized_index is not None:
+                with self._quantized_lock:
+                    self._quantized_index.delete([doc_id])
+                    self._quantized_index.add([doc_id], embeddings)
+            self._invalidate_caches([doc_id])
             
-            CliLogger.success("Document updated successfully!", context='update')
-            logger.info(f"Updated document {doc_id}")
+            if CliLogger.enabled:
+                CliLogger.success("Document updated successfully!", context='update')
+            logger.info("Updated document %s", doc_id)
         except Exception as e:
             CliLogger.error(f"Error updating document: {str(e)}")
-            logger.error(f"Error updating document {doc_id}: {str(e)}")
+            logger.error("Error updating document %s: %s", doc_id, e)
             raise
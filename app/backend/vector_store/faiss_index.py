@@ -0,0 +1,275 @@
+"""
+FAISS IVF-PQ index for Research Assistant.
+
+This module provides a product-quantized FAISS index for collections too
+large to keep as a full-precision HNSW graph in memory. Vectors live in the
+FAISS index while document text and metadata are kept in a SQLite file
+alongside it. Until enough vectors have been added to train the index, they
+are buffered in SQLite and searched exactly. The class mirrors the parts of
+the ChromaDB collection API used by ``ChromaDocStore`` so it can be used in
+place of a collection.
+"""
+
+import faiss
+import numpy as np
+import sqlite3
+import threading
+import json
+import logging
+import os
+from typing import List, Dict, Optional, Any, Tuple
+
+# Setup logging
+logger = logging.getLogger('research_assistant.vector_store')
+
+class FaissIVFPQIndex:
+    """Collection-like wrapper around a FAISS IVF-PQ index."""
+
+    def __init__(
+        self,
+        index_path: str,
+        dimension: int,
+        index_factory: str = "IVF4096,PQ64",
+        nprobe: int = 16,
+        memory_map: bool = False
+    ):
+        """
+        Open or create a FAISS IVF-PQ index.
+
+        Args:
+            index_path: Path of the FAISS index file. Documents and metadata
+                are stored next to it in ``<index_path>.sqlite3``.
+            dimension: Embedding dimension
+            index_factory: FAISS index factory string. The index is
+                trained once the collection holds at least as many vectors
+                as IVF lists (and 256 for the PQ codebooks); ideally ~40x
+                the number of lists.
+            nprobe: Number of inverted lists scanned per query
+            memory_map: Open an existing index file memory-mapped and
+                read-only. The OS pages in only the inverted lists that
+                queries touch instead of loading the whole index, at the
+                cost of page-cache pressure and disk reads on cold lists.
+        """
+        self.index_path = index_path
+        self.dimension = dimension
+        self.read_only = memory_map and os.path.exists(index_path)
+        self._lock = threading.Lock()
+
+        if self.read_only:
+            self.index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        elif os.path.exists(index_path):
+            self.index = faiss.read_index(index_path)
+        else:
+            self.index = faiss.index_factory(dimension, index_factory, faiss.METRIC_L2)
+        ivf = faiss.extract_index_ivf(self.index)
+        ivf.nprobe = nprobe
+        # k-means needs at least one vector per IVF list and per PQ centroid
+        self.min_training_size = max(ivf.nlist, 256)
+
+        # Rows added before the index is trained keep their embedding here
+        # until training, after which the column is cleared
+        self._conn = sqlite3.connect(f"{index_path}.sqlite3", check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "key INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL, "
+            "document TEXT, metadata TEXT, embedding BLOB)"
+        )
+        self._conn.commit()
+
+        logger.info("Opened FAISS index at %s with %s vectors", index_path, self.index.ntotal)
+
+    def _keys_for(self, ids: List[str]) -> Dict[str, int]:
+        """Map document IDs to their integer FAISS keys."""
+        placeholders = ",".join("?" * len(ids))
+        rows = self._conn.execute(
+            f"SELECT id, key FROM documents WHERE id IN ({placeholders})", ids
+        ).fetchall()
+        return dict(rows)
+
+    def _check_writable(self) -> None:
+        """Reject writes to a memory-mapped, read-only index."""
+        if self.read_only:
+            raise RuntimeError(f"FAISS index {self.index_path} is memory-mapped read-only")
+
+    def _buffered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the keys and embeddings of rows waiting for training."""
+        rows = self._conn.execute(
+            "SELECT key, embedding FROM documents WHERE embedding IS NOT NULL ORDER BY key"
+        ).fetchall()
+        keys = np.asarray([row[0] for row in rows], dtype='int64')
+        vectors = np.frombuffer(b"".join(row[1] for row in rows), dtype='float32').reshape(-1, self.dimension)
+        return keys, vectors
+
+    def _train_if_ready(self) -> None:
+        """Train the index on the buffered vectors once there are enough."""
+        keys, vectors = self._buffered()
+        if len(keys) < self.min_training_size:
+            return
+        logger.info("Training FAISS index on %s vectors", len(keys))
+        self.index.train(vectors)
+        self.index.add_with_ids(vectors, keys)
+        self._conn.execute("UPDATE documents SET embedding = NULL")
+
+    def _search_buffered(self, queries: np.ndarray, n_results: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact squared-L2 search over the buffered vectors, in FAISS's layout."""
+        keys, vectors = self._buffered()
+        distances = ((queries[:, None, :] - vectors[None, :, :]) ** 2).sum(axis=2)
+        order = np.argsort(distances, axis=1)[:, :n_results]
+        return np.take_along_axis(distances, order, axis=1), keys[order]
+
+    def _persist(self) -> None:
+        """Write the FAISS index and commit pending SQLite changes."""
+        faiss.write_index(self.index, self.index_path)
+        self._conn.commit()
+
+    def add(
+        self,
+        ids: List[str],
+        embeddings: Any,
+        documents: List[str],
+        metadatas: List[Dict]
+    ) -> None:
+        """
+        Add vectors with their documents and metadata.
+
+        Vectors are buffered in SQLite until there are enough to train the
+        index, which then receives all of them at once.
+        """
+        self._check_writable()
+        vectors = np.ascontiguousarray(embeddings, dtype='float32')
+        with self._lock:
+            try:
+                trained = self.index.is_trained
+                start = self._conn.execute("SELECT COALESCE(MAX(key), -1) + 1 FROM documents").fetchone()[0]
+                keys = np.arange(start, start + len(ids), dtype='int64')
+                self._conn.executemany(
+                    "INSERT INTO documents (key, id, document, metadata, embedding) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (int(key), doc_id, document, json.dumps(metadata), None if trained else vector.tobytes())
+                        for key, doc_id, document, metadata, vector in zip(keys, ids, documents, metadatas, vectors)
+                    ]
+                )
+                if trained:
+                    self.index.add_with_ids(vectors, keys)
+                else:
+                    self._train_if_ready()
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._persist()
+
+    def query(
+        self,
+        query_embeddings: Any,
+        n_results: int = 5,
+        where: Optional[Dict] = None
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Search the index, returning results in ChromaDB's query layout.
+        """
+        if where:
+            raise ValueError("Metadata filters are not supported by the FAISS backend")
+
+        queries = np.asarray(query_embeddings, dtype='float32')
+        if not self.index.is_trained:
+            distances, keys = self._search_buffered(queries, n_results)
+        elif self.index.ntotal == 0:
+            distances = keys = np.empty((len(queries), 0))
+        else:
+            distances, keys = self.index.search(queries, n_results)
+
+        results: Dict[str, List[List[Any]]] = {'ids': [], 'documents': [], 'metadatas': [], 'distances': []}
+        for row_keys, row_distances in zip(keys, distances):
+            found = [(int(key), float(distance)) for key, distance in zip(row_keys, row_distances) if key != -1]
+            placeholders = ",".join("?" * len(found))
+            rows = {
+                key: (doc_id, document, metadata)
+                for key, doc_id, document, metadata in self._conn.execute(
+                    f"SELECT key, id, document, metadata FROM documents WHERE key IN ({placeholders})",
+                    [key for key, _ in found]
+                )
+            } if found else {}
+            hits = [(rows[key], distance) for key, distance in found if key in rows]
+            results['ids'].append([row[0] for row, _ in hits])
+            results['documents'].append([row[1] for row, _ in hits])
+            results['metadatas'].append([json.loads(row[2]) for row, _ in hits])
+            results['distances'].append([distance for _, distance in hits])
+        return results
+
+    def get(self, ids: List[str], include: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+        """
+        Fetch documents by ID, returning results in ChromaDB's get layout.
+
+        Passing ``include=[]`` only checks which IDs exist.
+        """
+        placeholders = ",".join("?" * len(ids))
+        if include == []:
+            rows = self._conn.execute(f"SELECT id FROM documents WHERE id IN ({placeholders})", ids)
+            return {'ids': [row[0] for row in rows]}
+
+        rows = self._conn.execute(
+            f"SELECT id, document, metadata FROM documents WHERE id IN ({placeholders})", ids
+        ).fetchall()
+        return {
+            'ids': [row[0] for row in rows],
+            'documents': [row[1] for row in rows],
+            'metadatas': [json.loads(row[2]) for row in rows]
+        }
+
+    def update(
+        self,
+        ids: List[str],
+        embeddings: Any,
+        documents: List[str],
+        metadatas: List[Dict]
+    ) -> None:
+        """
+        Replace the vectors and documents of existing IDs.
+
+        The new metadata is merged into the stored metadata, as ChromaDB
+        does, rather than replacing it.
+        """
+        self._check_writable()
+        vectors = np.ascontiguousarray(embeddings, dtype='float32')
+        with self._lock:
+            try:
+                placeholders = ",".join("?" * len(ids))
+                stored = dict(self._conn.execute(
+                    f"SELECT id, metadata FROM documents WHERE id IN ({placeholders})", ids
+                ).fetchall())
+                trained = self.index.is_trained
+                self._conn.executemany(
+                    "UPDATE documents SET document = ?, metadata = ?, embedding = ? WHERE id = ?",
+                    [
+                        (
+                            document,
+                            json.dumps({**json.loads(stored[doc_id] or "{}"), **(metadata or {})}),
+                            None if trained else vector.tobytes(),
+                            doc_id
+                        )
+                        for doc_id, document, metadata, vector in zip(ids, documents, metadatas, vectors)
+                    ]
+                )
+                if trained:
+                    key_map = self._keys_for(ids)
+                    keys = np.asarray([key_map[doc_id] for doc_id in ids], dtype='int64')
+                    self.index.remove_ids(keys)
+                    self.index.add_with_ids(vectors, keys)
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._persist()
+
+    def delete(self, ids: List[str]) -> None:
+        """Remove vectors and documents by ID."""
+        self._check_writable()
+        with self._lock:
+            try:
+                keys = list(self._keys_for(ids).values())
+                self._conn.executemany("DELETE FROM documents WHERE id = ?", [(doc_id,) for doc_id in ids])
+                if keys and self.index.is_trained:
+                    self.index.remove_ids(np.asarray(keys, dtype='int64'))
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._persist()
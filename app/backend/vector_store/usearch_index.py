@@ -0,0 +1,199 @@
+"""
+Quantized USearch index for Research Assistant.
+
+This module keeps a compact int8 or binary copy of the stored embeddings in
+a USearch HNSW index. Vectors are searched in the quantized space and the
+matching document IDs are resolved back to ChromaDB, which remains the store
+of record for document text and metadata. Writes are kept in memory until
+:meth:`USearchQuantizedIndex.flush` saves the index file.
+"""
+
+from usearch.index import Index, BatchMatches
+import numpy as np
+import sqlite3
+import threading
+import logging
+import os
+from typing import List, Tuple, Any
+
+# Setup logging
+logger = logging.getLogger('research_assistant.vector_store')
+
+# USearch scalar kind and matching metric for each supported quantization
+QUANTIZATIONS = {
+    'i8': ('i8', 'cos'),
+    'b1': ('b1', 'hamming'),
+}
+
+class USearchQuantizedIndex:
+    """USearch index over int8 or binary quantized embeddings."""
+
+    def __init__(
+        self,
+        index_path: str,
+        dimension: int,
+        quantization: str = "i8",
+        connectivity: int = 16,
+        expansion_add: int = 64,
+        memory_map: bool = False
+    ):
+        """
+        Open or create a quantized USearch index.
+
+        Args:
+            index_path: Path of the USearch index file. The mapping between
+                integer keys and document IDs is stored next to it in
+                ``<index_path>.sqlite3``.
+            dimension: Embedding dimension
+            quantization: 'i8' (4x smaller than float32) or 'b1'
+                (32x smaller, sign bits compared by Hamming distance)
+            connectivity: Maximum number of neighbours per graph node
+            expansion_add: Candidate list size used while building the graph
+            memory_map: View an existing index file memory-mapped and
+                read-only, so only the graph regions visited by searches
+                are paged in
+        """
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unsupported quantization: {quantization}")
+
+        self.index_path = index_path
+        self.quantization = quantization
+        self.read_only = memory_map and os.path.exists(index_path)
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        dtype, metric = QUANTIZATIONS[quantization]
+        self.index = Index(
+            ndim=dimension,
+            metric=metric,
+            dtype=dtype,
+            connectivity=connectivity,
+            expansion_add=expansion_add
+        )
+        if self.read_only:
+            self.index.view(index_path)
+        elif os.path.exists(index_path):
+            self.index.load(index_path)
+
+        self._conn = sqlite3.connect(f"{index_path}.sqlite3", check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS vector_keys (key INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL)")
+        self._conn.commit()
+
+        # Keys committed after the index file was last saved have no vector,
+        # so start empty and let the caller rebuild
+        stored = self._conn.execute("SELECT COUNT(*) FROM vector_keys").fetchone()[0]
+        if stored != len(self.index) and not self.read_only:
+            logger.warning("USearch index at %s is out of date, clearing it", index_path)
+            self.clear()
+
+        logger.info("Opened %s USearch index at %s with %s vectors", quantization, index_path, len(self.index))
+
+    def _prepare(self, embeddings: Any) -> np.ndarray:
+        """Convert float embeddings into the layout expected by the index."""
+        vectors = np.asarray(embeddings, dtype='float32')
+        if self.quantization == 'b1':
+            return np.packbits(vectors > 0, axis=1)
+        return vectors
+
+    def _ids_for(self, ids: List[str]) -> List[str]:
+        """Return which of the given document IDs are indexed."""
+        placeholders = ",".join("?" * len(ids))
+        rows = self._conn.execute(f"SELECT id FROM vector_keys WHERE id IN ({placeholders})", ids)
+        return [row[0] for row in rows]
+
+    def _keys_for(self, ids: List[str]) -> List[int]:
+        """Return the integer keys of the given document IDs."""
+        placeholders = ",".join("?" * len(ids))
+        rows = self._conn.execute(f"SELECT key FROM vector_keys WHERE id IN ({placeholders})", ids)
+        return [row[0] for row in rows]
+
+    def _check_writable(self) -> None:
+        """Reject writes to a memory-mapped, read-only index."""
+        if self.read_only:
+            raise RuntimeError(f"USearch index {self.index_path} is memory-mapped read-only")
+
+    def count(self) -> int:
+        """Return the number of indexed vectors."""
+        return len(self.index)
+
+    def clear(self) -> None:
+        """Remove every vector and key mapping."""
+        self._check_writable()
+        with self._lock:
+            self.index.clear()
+            self._conn.execute("DELETE FROM vector_keys")
+            self._conn.commit()
+            self._dirty = True
+
+    def add(self, ids: List[str], embeddings: Any) -> None:
+        """Add embeddings under the given document IDs, skipping IDs already indexed."""
+        self._check_writable()
+        vectors = self._prepare(embeddings)
+        with self._lock:
+            existing = set(self._ids_for(ids))
+            if existing:
+                keep = [i for i, doc_id in enumerate(ids) if doc_id not in existing]
+                ids = [ids[i] for i in keep]
+                vectors = vectors[keep]
+            if not ids:
+                return
+            start = self._conn.execute("SELECT COALESCE(MAX(key), -1) + 1 FROM vector_keys").fetchone()[0]
+            keys = np.arange(start, start + len(ids), dtype='uint64')
+            self._conn.executemany(
+                "INSERT INTO vector_keys (key, id) VALUES (?, ?)",
+                [(int(key), doc_id) for key, doc_id in zip(keys, ids)]
+            )
+            try:
+                self.index.add(keys, vectors)
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+            self._dirty = True
+
+    def delete(self, ids: List[str]) -> None:
+        """Remove the embeddings of the given document IDs."""
+        self._check_writable()
+        with self._lock:
+            keys = self._keys_for(ids)
+            if keys:
+                self.index.remove(np.asarray(keys, dtype='uint64'))
+            self._conn.executemany("DELETE FROM vector_keys WHERE id = ?", [(doc_id,) for doc_id in ids])
+            self._conn.commit()
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Save the index file if it changed since it was last saved."""
+        with self._lock:
+            if self._dirty:
+                self.index.save(self.index_path)
+                self._dirty = False
+
+    def search(self, query_embeddings: Any, n_results: int) -> List[Tuple[List[str], List[float]]]:
+        """
+        Find the nearest neighbours of each query embedding.
+
+        Returns:
+            One ``(ids, distances)`` pair per query, ordered by distance
+        """
+        matches = self.index.search(self._prepare(query_embeddings), n_results)
+        # A single query returns Matches, already trimmed to the hits found;
+        # several queries return padded BatchMatches with per-row counts
+        if isinstance(matches, BatchMatches):
+            rows = [
+                (row_keys[:count], row_distances[:count])
+                for row_keys, row_distances, count in zip(matches.keys, matches.distances, matches.counts)
+            ]
+        else:
+            rows = [(matches.keys, matches.distances)]
+
+        results = []
+        for row_keys, row_distances in rows:
+            row_keys = [int(key) for key in row_keys]
+            placeholders = ",".join("?" * len(row_keys))
+            id_map = dict(self._conn.execute(
+                f"SELECT key, id FROM vector_keys WHERE key IN ({placeholders})", row_keys
+            )) if row_keys else {}
+            hits = [(id_map[key], float(distance)) for key, distance in zip(row_keys, row_distances) if key in id_map]
+            results.append(([doc_id for doc_id, _ in hits], [distance for _, distance in hits]))
+        return results
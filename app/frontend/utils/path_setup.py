@@ -1,8 +1,16 @@
 import os
 import sys
 
+# Set once the project root has been added, so repeated calls from many
+# modules skip the path computation and the sys.path scan
+_ADDED = False
+
 def add_project_root_to_path():
     """Add the project root directory to Python path."""
+    global _ADDED
+    if _ADDED:
+        return
     current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     if current_dir not in sys.path:
         sys.path.insert(0, current_dir)
+    _ADDED = True
@@ -1,5 +1,5 @@
 """Utility modules for Research Assistant."""
 
-from .logging_config import setup_logging, performance_monitor, error_tracker
+from .logging_config import setup_logging, performance_monitor, error_tracker, FAST_PATH
 
-__all__ = ['setup_logging', 'performance_monitor', 'error_tracker']
+__all__ = ['setup_logging', 'performance_monitor', 'error_tracker', 'FAST_PATH']
@@ -5,6 +5,7 @@ Enhanced CLI logger with emojis and styled output for ARK AI.
 import logging
 from datetime import datetime
 from typing import Any, Optional
+import os
 import sys
 from rich.console import Console
 from rich.theme import Theme
@@ -23,6 +24,10 @@ console = Console(theme=Theme({
 class CliLogger:
     """Enhanced CLI logger with emojis and styled output."""
     
+    # Styled console output can be switched off (RA_CLI_LOG=0) for batch
+    # jobs; hot paths check this before building message details
+    enabled = os.environ.get('RA_CLI_LOG', '1').lower() not in ('0', 'false')
+    
     # Emoji mappings for different contexts
     EMOJI_MAP = {
         # System states
@@ -77,12 +82,16 @@ class CliLogger:
     @classmethod
     def info(cls, message: str, context: str = 'info', **kwargs):
         """Log an info message with style."""
+        if not cls.enabled:
+            return
         styled_msg = cls.style_message(message, context, kwargs)
         console.print(styled_msg, style='info')
 
     @classmethod
     def success(cls, message: str, context: str = 'done', **kwargs):
         """Log a success message with style."""
+        if not cls.enabled:
+            return
         styled_msg = cls.style_message(message, context, kwargs)
         console.print(styled_msg, style='success')
 
@@ -25,6 +25,11 @@ from pythonjsonlogger import jsonlogger
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
 
+# When RA_FAST is set (to anything but '0' or 'false'), the monitoring
+# decorators return the wrapped function unchanged at import time, removing
+# their per-call overhead in production
+FAST_PATH = os.environ.get('RA_FAST', '0').lower() not in ('', '0', 'false')
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter for structured logging."""
     
@@ -57,6 +62,9 @@ class PerformanceMonitor:
     
     def log_execution_time(self, func):
         """Decorator to log function execution time."""
+        if FAST_PATH:
+            return func
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             start_time = time.time()
@@ -125,6 +133,9 @@ class ErrorTracker:
     def handle_exception(self, context: Optional[Dict[str, Any]] = None):
         """Decorator for exception handling and logging."""
         def decorator(func):
+            if FAST_PATH:
+                return func
+            
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
                 try:
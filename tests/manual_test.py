@@ -83,10 +83,11 @@ def main():
             documents = [chunk.page_content for chunk in chunks_with_embeddings]
             metadatas = [chunk.metadata for chunk in chunks_with_embeddings]
             
-            vector_store.add_documents(
-                documents=documents,
-                metadatas=metadatas
-            )
+            with vector_store.bulk_mode():
+                vector_store.add_documents(
+                    documents=documents,
+                    metadatas=metadatas
+                )
             logger.info("Added documents to vector store")
             
             # Test search
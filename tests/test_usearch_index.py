@@ -0,0 +1,78 @@
+"""
+Tests for the quantized USearch index.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("usearch")
+# Importing the module runs the vector_store package __init__
+pytest.importorskip("chromadb")
+pytest.importorskip("torch")
+
+from app.backend.vector_store.usearch_index import USearchQuantizedIndex
+
+DIMENSION = 16
+
+
+@pytest.fixture
+def embeddings():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((3, DIMENSION)).astype(np.float32)
+
+
+@pytest.mark.parametrize("quantization", ["i8", "b1"])
+def test_single_query_search(tmp_path, embeddings, quantization):
+    index = USearchQuantizedIndex(str(tmp_path / "docs.usearch"), DIMENSION, quantization)
+    index.add(["a", "b", "c"], embeddings)
+
+    results = index.search(embeddings[:1], n_results=5)
+
+    assert len(results) == 1
+    ids, distances = results[0]
+    assert ids[0] == "a"
+    assert sorted(ids) == ["a", "b", "c"]
+    assert len(distances) == len(ids)
+
+
+@pytest.mark.parametrize("quantization", ["i8", "b1"])
+def test_batch_query_search(tmp_path, embeddings, quantization):
+    index = USearchQuantizedIndex(str(tmp_path / "docs.usearch"), DIMENSION, quantization)
+    index.add(["a", "b", "c"], embeddings)
+
+    results = index.search(embeddings[:2], n_results=5)
+
+    assert [ids[0] for ids, _ in results] == ["a", "b"]
+    assert all(len(ids) == 3 for ids, _ in results)
+
+
+def test_deleted_ids_are_not_returned(tmp_path, embeddings):
+    index = USearchQuantizedIndex(str(tmp_path / "docs.usearch"), DIMENSION)
+    index.add(["a", "b", "c"], embeddings)
+    index.delete(["a"])
+
+    ids, _ = index.search(embeddings[:1], n_results=5)[0]
+
+    assert "a" not in ids
+
+
+def test_reopen_after_flush(tmp_path, embeddings):
+    path = str(tmp_path / "docs.usearch")
+    index = USearchQuantizedIndex(path, DIMENSION)
+    index.add(["a", "b", "c"], embeddings)
+    index.flush()
+
+    reopened = USearchQuantizedIndex(path, DIMENSION)
+
+    assert reopened.count() == 3
+    assert reopened.search(embeddings[:1], n_results=1)[0][0] == ["a"]
+
+
+def test_reopen_without_flush_starts_empty(tmp_path, embeddings):
+    path = str(tmp_path / "docs.usearch")
+    index = USearchQuantizedIndex(path, DIMENSION)
+    index.add(["a", "b", "c"], embeddings)
+
+    reopened = USearchQuantizedIndex(path, DIMENSION)
+
+    assert reopened.count() == 0